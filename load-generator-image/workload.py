@@ -11,15 +11,26 @@ Python workload that:
 
 from __future__ import annotations
 
+import array
+import asyncio
+import bisect
+import heapq
+import itertools
 import logging
 import os
 import threading
 import time
-from typing import Final
-
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+import aiohttp
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from hdrh.histogram import HdrHistogram
 from prometheus_client import Counter, Gauge, Histogram, start_http_server
-from web3 import Web3
-from web3.exceptions import Web3Exception
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3, WebsocketProviderV2
+from web3.exceptions import TimeExhausted, Web3Exception
 
 
 LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "INFO")
@@ -30,6 +41,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger("workload")
 
+# Gas price only moves on block cadence, so workers read a cached value that a
+# background thread refreshes instead of issuing eth_gasPrice per transaction.
+# None means not seeded yet; 0 is a valid price (e.g. --miner.gasprice 0).
+GAS_PRICE_REFRESH_SECONDS: Final[float] = 2.0
+_gas_price_cache: list[int | None] = [None]
+
+# Receipts for all in-flight transactions are fetched in one JSON-RPC batch
+# per poll instead of one eth_getTransactionReceipt POST per worker.
+RECEIPT_POLL_INTERVAL_SECONDS: Final[float] = 0.5
+RECEIPT_TIMEOUT_SECONDS: Final[float] = 30.0
+# Geth rejects batches over --rpc.batch-request-limit (default 1000), so each
+# poll is split into POSTs of at most this many calls.
+RECEIPT_BATCH_SIZE: Final[int] = 500
+# A slow batch is abandoned and retried on the next poll rather than holding
+# up every pending receipt behind aiohttp's 5-minute default timeout.
+RECEIPT_POLL_TIMEOUT_SECONDS: Final[float] = 2.0
+
+# Latency percentiles come from an HdrHistogram at microsecond resolution, so
+# memory stays fixed no matter how many transactions a cycle sends.
+LATENCY_HDR_MAX_US: Final[int] = 120_000_000
+LATENCY_HDR_SIGNIFICANT_FIGURES: Final[int] = 3
+
+# Senders hand tx hashes to a separate pool of receipt waiters, so submission
+# is never blocked on inclusion. By default there are enough waiters to keep
+# ~12s of submissions in flight (two blocks at --dev.period=6).
+RECEIPT_WAITERS_PER_TPS: Final[int] = 12
+
+# Raw-send errors meaning the nonce is already taken by a transaction from
+# this account; with a dedicated sender that is one this process issued.
+NONCE_IN_USE_ERRORS: Final[tuple[str, ...]] = (
+    "already known",
+    "nonce too low",
+    "replacement transaction underpriced",
+)
+
 
 METRIC_TPS = Gauge(
     "geth_workload_tps",
@@ -51,10 +97,27 @@ METRIC_LATENCY = Gauge(
     "geth_workload_avg_latency_seconds",
     "Average transaction latency in seconds over the test window",
 )
+METRIC_LATENCY_P50 = Gauge(
+    "geth_workload_latency_p50_seconds",
+    "Median transaction latency in seconds over the test window",
+)
+METRIC_LATENCY_P95 = Gauge(
+    "geth_workload_latency_p95_seconds",
+    "95th percentile transaction latency in seconds over the test window",
+)
+METRIC_LATENCY_P99 = Gauge(
+    "geth_workload_latency_p99_seconds",
+    "99th percentile transaction latency in seconds over the test window",
+)
+
+# Workers bucket latencies locally against these bounds and the counts are
+# flushed into LATENCY_HISTOGRAM once per cycle, see _flush_latency_histogram.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = Histogram.DEFAULT_BUCKETS
 
 LATENCY_HISTOGRAM = Histogram(
     "geth_workload_tx_latency_seconds",
     "Histogram of transaction latency in seconds",
+    buckets=LATENCY_BUCKETS,
 )
 
 RPC_ERROR_COUNTER = Counter(
@@ -83,19 +146,218 @@ def get_geth_url() -> str:
     )
 
 
-def _run_load(
-    w3: Web3,
+def _refresh_gas_price(w3: Web3) -> None:
+    """
+    Periodically refresh the cached gas price read by the load workers.
+
+    A single list slot is replaced on each refresh; the store is atomic in
+    CPython, so readers never need a lock.
+    """
+    while True:
+        try:
+            _gas_price_cache[0] = w3.eth.gas_price
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to refresh gas price: %s", exc)
+        time.sleep(GAS_PRICE_REFRESH_SECONDS)
+
+
+class _ReceiptPoller:
+    """
+    Batch eth_getTransactionReceipt polls for every pending transaction.
+
+    Workers register a tx hash via wait() and await a future; run() covers
+    all pending hashes once per poll interval, in JSON-RPC batches of at
+    most RECEIPT_BATCH_SIZE calls, and resolves the futures whose receipts
+    have landed. Receipts are returned as raw JSON-RPC dicts, so quantities
+    are hex strings.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, geth_url: str) -> None:
+        self._session = session
+        self._geth_url = geth_url
+        self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        # JSON-RPC calls issued, for the RPC rate estimate
+        self.rpc_calls = 0
+
+    async def wait(self, tx_hash: str, timeout: float) -> dict[str, Any]:
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[tx_hash] = future
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {tx_hash} is not in the chain after {timeout} seconds"
+            ) from None
+        finally:
+            self._pending.pop(tx_hash, None)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(RECEIPT_POLL_INTERVAL_SECONDS)
+            if not self._pending:
+                continue
+            hashes = list(self._pending)
+            for i in range(0, len(hashes), RECEIPT_BATCH_SIZE):
+                try:
+                    await self._poll_batch(hashes[i : i + RECEIPT_BATCH_SIZE])
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("Batched receipt poll failed: %r", exc)
+
+    async def _poll_batch(self, hashes: list[str]) -> None:
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_getTransactionReceipt",
+                "params": [tx_hash],
+            }
+            for i, tx_hash in enumerate(hashes)
+        ]
+        self.rpc_calls += len(payload)
+        async with self._session.post(
+            self._geth_url,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=RECEIPT_POLL_TIMEOUT_SECONDS),
+        ) as resp:
+            resp.raise_for_status()
+            results = await resp.json()
+
+        # A rejected batch comes back as a single error object, not a list
+        if isinstance(results, dict):
+            results = [results]
+        for item in results:
+            if item.get("error") is not None:
+                logger.warning("Receipt poll returned error: %s", item["error"])
+                continue
+            receipt = item.get("result")
+            if receipt is None:
+                continue
+            future = self._pending.get(hashes[item["id"]])
+            if future is not None and not future.done():
+                future.set_result(receipt)
+
+
+def _flush_latency_histogram(bucket_counts: Sequence[int], latency_sum: float) -> None:
+    """
+    Add pre-bucketed latency counts to LATENCY_HISTOGRAM in one pass.
+
+    prometheus_client only exposes per-sample observe(), which scans the
+    bucket list and takes a value lock for every transaction. Incrementing
+    the (non-cumulative) bucket and sum values directly is equivalent to
+    observing each sample, at one increment per bucket per cycle.
+    """
+    for i, count in enumerate(bucket_counts):
+        if count:
+            LATENCY_HISTOGRAM._buckets[i].inc(count)
+    LATENCY_HISTOGRAM._sum.inc(latency_sum)
+
+
+async def _follow_new_heads(ws_url: str) -> None:
+    """
+    Keep HEAD_BLOCK current from eth_subscribe("newHeads") pushes.
+
+    Returns when the subscription stream ends; connection errors propagate
+    so the caller can fall back to polling.
+    """
+    async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(ws_url)) as w3_ws:
+        await w3_ws.eth.subscribe("newHeads")
+        async for message in w3_ws.ws.process_subscriptions():
+            number = message["result"]["number"]
+            HEAD_BLOCK.set(float(int(number, 16) if isinstance(number, str) else number))
+
+
+@dataclass
+class _AsyncClient:
+    """Event loop, aiohttp pool and AsyncWeb3 client shared by all load cycles."""
+
+    loop: asyncio.AbstractEventLoop
+    session: aiohttp.ClientSession
+    w3: AsyncWeb3
+
+
+# Kept for the process lifetime, including main() retries, keyed by URL
+_async_clients: dict[str, _AsyncClient] = {}
+
+
+async def _open_async_client(geth_url: str, pool_size: int) -> _AsyncClient:
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=pool_size),
+        raise_for_status=True,
+    )
+    provider = AsyncHTTPProvider(geth_url)
+    if await provider.cache_async_session(session) is not session:
+        await session.close()
+        raise RuntimeError(f"web3 did not adopt the load session for {geth_url}")
+    return _AsyncClient(asyncio.get_running_loop(), session, AsyncWeb3(provider))
+
+
+def _get_async_client(geth_url: str, pool_size: int) -> _AsyncClient:
+    """
+    Return the async client used for load cycles, creating it on first use.
+
+    web3 caches its aiohttp session per thread and URL and ignores a session
+    passed in once that entry exists; after the owning loop closes it swaps
+    in an unsized default session instead. Every cycle therefore runs on one
+    event loop with one pooled session, created here and checked to be the
+    one the provider actually uses.
+    """
+    client = _async_clients.get(geth_url)
+    if client is None:
+        loop = asyncio.new_event_loop()
+        client = loop.run_until_complete(_open_async_client(geth_url, pool_size))
+        _async_clients[geth_url] = client
+    return client
+
+
+@dataclass
+class _WorkerStats:
+    """
+    Per-worker counters for a single load run.
+
+    Each sender and receipt waiter owns exactly one instance and is the only
+    writer, so the hot path needs no lock; the totals are summed once all
+    workers have finished.
+    """
+
+    sent: int = 0
+    failed: int = 0
+    rpc_errors: int = 0
+    rpc_calls: int = 0
+    gas_used: int = 0
+    latency_count: int = 0
+    latency_sum: float = 0.0
+    latency_buckets: array.array[int] = field(
+        default_factory=lambda: array.array("Q", [0] * len(LATENCY_BUCKETS))
+    )
+
+
+async def _run_load(
+    w3: AsyncWeb3,
+    session: aiohttp.ClientSession,
+    geth_url: str,
     from_address: str,
     to_address: str,
     target_tps: int,
     concurrency: int,
     duration_seconds: int,
+    sender: LocalAccount | None = None,
+    receipt_concurrency: int = 0,
 ) -> None:
     """
     Generate transaction load with the given TPS and concurrency.
 
-    Each worker thread sends simple value transfers in a loop, pacing itself
-    to achieve approximately target_tps across all workers.
+    Each of the concurrency sender coroutines submits simple value transfers
+    in a loop, pacing itself to achieve approximately target_tps across all
+    senders, and queues each tx hash with its start time. A separate pool of
+    receipt_concurrency waiters (derived from target_tps when <= 0) drains
+    the queue and awaits inclusion, so the send rate is not capped by block
+    time. All coroutines share the event loop and aiohttp connection pool of
+    the long-lived _AsyncClient, so CONCURRENCY is bounded by open sockets
+    rather than OS threads.
+
+    When sender is given, transactions are signed locally and submitted with
+    eth_sendRawTransaction, so the node never serializes on its own account
+    lock; otherwise the node signs with from_address via eth_sendTransaction.
     """
     if target_tps <= 0 or concurrency <= 0:
         logger.info("TARGET_TPS and CONCURRENCY must be > 0; skipping load generation.")
@@ -111,96 +373,217 @@ def _run_load(
         per_worker_tps = 1.0
 
     interval = 1.0 / per_worker_tps
-    stop_at = time.time() + duration_seconds
+
+    if receipt_concurrency <= 0:
+        receipt_concurrency = max(concurrency, target_tps * RECEIPT_WAITERS_PER_TPS)
 
     logger.info(
         "Starting load: target_tps=%s, concurrency=%s, per_worker_tps=%.2f, "
-        "interval=%.3fs, duration=%ss",
+        "interval=%.3fs, duration=%ss, receipt_concurrency=%s",
         target_tps,
         concurrency,
         per_worker_tps,
         interval,
         duration_seconds,
+        receipt_concurrency,
     )
 
-    total_sent = 0
-    total_failed = 0
-    total_gas_used = 0
-    latencies: list[float] = []
-    lock = threading.Lock()
-
-    def worker(worker_id: int) -> None:
-        nonlocal total_sent, total_failed, total_gas_used
-        while time.time() < stop_at:
-            start = time.perf_counter()
+    send_stats = [_WorkerStats() for _ in range(concurrency)]
+    await_stats = [_WorkerStats() for _ in range(receipt_concurrency)]
+    stats = send_stats + await_stats
+
+    # Loop-invariant; to_wei goes through Decimal arithmetic on every call
+    value_wei = w3.to_wei(0.01, "ether")
+
+    # Nonces and chain id are fetched once per cycle for local signing. All
+    # workers run on one event loop, so a shared counter hands out nonces
+    # without gaps between workers. A send that fails without using its nonce
+    # returns it to a min-heap that is drained before the counter, so the gap
+    # it would leave is refilled without moving the counter backwards.
+    chain_id = 0
+    nonces = itertools.count()
+    reuse_nonces: list[int] = []
+    if sender is not None:
+        try:
+            chain_id = await w3.eth.chain_id
+            nonces = itertools.count(
+                await w3.eth.get_transaction_count(sender.address, "pending")
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Failed to fetch chain id/nonce for %s; skipping load cycle: %s",
+                sender.address,
+                exc,
+            )
+            return
+
+    # Workers share one event loop, so a single histogram needs no merging
+    latency_hist = HdrHistogram(1, LATENCY_HDR_MAX_US, LATENCY_HDR_SIGNIFICANT_FIGURES)
+
+    # perf_counter is monotonic, so the deadline is immune to NTP slew and
+    # the per-tx start timestamp doubles as the deadline check
+    stop_at = time.perf_counter() + duration_seconds
+
+    # Node-signed sends also trigger eth_chainId (web3 validation middleware)
+    # and eth_getBlockByNumber (gas price strategy middleware) per call;
+    # eth_sendRawTransaction goes out on its own
+    rpcs_per_send = 1 if sender is not None else 3
+
+    # (tx_hash, start) pairs handed from senders to receipt waiters
+    pending: asyncio.Queue[tuple[str, float]] = asyncio.Queue()
+
+    async def send_worker(worker_id: int) -> None:
+        local = send_stats[worker_id]
+        # Bind hot-path callables and constants as locals so each tx uses
+        # LOAD_FAST instead of global/closure/attribute lookups
+        _pc = time.perf_counter
+        _sleep = asyncio.sleep
+        _interval = interval
+        sign = w3.eth.account.sign_transaction
+        send_tx = w3.eth.send_transaction
+        send_raw_tx = w3.eth.send_raw_transaction
+        pop_nonce = heapq.heappop
+        push_nonce = heapq.heappush
+        to_hex = w3.to_hex
+        enqueue = pending.put_nowait
+        gas_price_cache = _gas_price_cache
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        # Only gasPrice changes between sends; reuse one dict for the whole run
+        tx = {
+            "from": from_address,
+            "to": to_address,
+            "value": value_wei,
+            "gas": 21000,
+            "gasPrice": 0,
+        }
+        if sender is not None:
+            tx["chainId"] = chain_id
+        while True:
+            start = _pc()
+            if start >= stop_at:
+                break
+            # Gas price is cached; receipts are polled in batches by the poller
+            local.rpc_calls += rpcs_per_send
             try:
-                # Each tx will use 2–3 RPCs (gas_price, send_transaction, receipt)
-                tx = {
-                    "from": from_address,
-                    "to": to_address,
-                    "value": w3.to_wei(0.01, "ether"),
-                    "gas": 21000,
-                    "gasPrice": w3.eth.gas_price,
-                }
-
-                tx_hash = w3.eth.send_transaction(tx)
-                receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
-
-                duration = time.perf_counter() - start
-                gas_used = receipt.get("gasUsed", 0) or 0
-
-                # Record successful latency in the histogram
-                LATENCY_HISTOGRAM.observe(duration)
-
-                with lock:
-                    total_sent += 1
-                    if receipt.get("status", 0) != 1:
-                        total_failed += 1
-                    total_gas_used += gas_used
-                    latencies.append(duration)
-
-                logger.debug(
-                    "Worker %s: tx %s in block %s",
-                    worker_id,
-                    tx_hash.hex(),
-                    receipt.get("blockNumber"),
-                )
+                tx["gasPrice"] = gas_price_cache[0]
+                tx_hash: str | None
+                if sender is not None:
+                    nonce = pop_nonce(reuse_nonces) if reuse_nonces else next(nonces)
+                    tx["nonce"] = nonce
+                    signed = sign(tx, sender.key)
+                    try:
+                        tx_hash = to_hex(await send_raw_tx(signed.rawTransaction))
+                    except Exception as exc:  # noqa: BLE001
+                        reason = str(exc).lower()
+                        if not any(marker in reason for marker in NONCE_IN_USE_ERRORS):
+                            # The nonce was never used; hand it to the next send
+                            # so later nonces are not queued behind a gap
+                            push_nonce(reuse_nonces, nonce)
+                            raise
+                        # An earlier send of ours already holds this nonce. Only
+                        # an identical tx ("already known") has a hash to track.
+                        tx_hash = to_hex(signed.hash) if "already known" in reason else None
+                        if debug_enabled:
+                            logger.debug("Worker %s: nonce %s already in use: %s", worker_id, nonce, exc)
+                else:
+                    tx_hash = to_hex(await send_tx(tx))
+                if tx_hash is not None:
+                    enqueue((tx_hash, start))
+            except Exception as exc:  # noqa: BLE001
+                local.failed += 1
+                local.rpc_errors += 1
+                logger.warning("Worker %s: tx send failed: %s", worker_id, exc)
+
+            # Pace to target TPS; sleep(0) still yields to the other workers
+            await _sleep(max(0.0, _interval - (_pc() - start)))
+
+    async def receipt_worker(waiter_id: int) -> None:
+        local = await_stats[waiter_id]
+        _pc = time.perf_counter
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        dequeue = pending.get
+        task_done = pending.task_done
+        wait_receipt = poller.wait
+        receipt_timeout = RECEIPT_TIMEOUT_SECONDS
+        bucket_index = bisect.bisect_left
+        bucket_bounds = LATENCY_BUCKETS
+        bucket_counts = local.latency_buckets
+        record_latency = latency_hist.record_value
+        hdr_max_us = LATENCY_HDR_MAX_US
+        while True:
+            tx_hash, start = await dequeue()
+            try:
+                receipt = await wait_receipt(tx_hash, receipt_timeout)
+
+                # Latency still spans submission to inclusion, including queueing
+                duration = _pc() - start
+                gas_used = int(receipt.get("gasUsed") or "0x0", 16)
+
+                local.sent += 1
+                if int(receipt.get("status") or "0x0", 16) != 1:
+                    local.failed += 1
+                local.gas_used += gas_used
+                local.latency_count += 1
+                local.latency_sum += duration
+                # Bounds end with +Inf, so the index is always in range
+                bucket_counts[bucket_index(bucket_bounds, duration)] += 1
+                record_latency(min(max(int(duration * 1_000_000), 1), hdr_max_us))
+
+                if debug_enabled:
+                    logger.debug(
+                        "Waiter %s: tx %s in block %s",
+                        waiter_id,
+                        tx_hash,
+                        receipt.get("blockNumber"),
+                    )
             except Exception as exc:  # noqa: BLE001
-                with lock:
-                    total_failed += 1
-                RPC_ERROR_COUNTER.inc()
-                logger.warning("Worker %s: tx failed: %s", worker_id, exc)
-
-            # Pace to target TPS
-            elapsed = time.perf_counter() - start
-            sleep_for = interval - elapsed
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-
-    threads = [
-        threading.Thread(target=worker, args=(i,), daemon=True)
-        for i in range(concurrency)
+                local.failed += 1
+                local.rpc_errors += 1
+                logger.warning("Waiter %s: tx %s failed: %s", waiter_id, tx_hash, exc)
+            finally:
+                task_done()
+
+    # The event loop outlives this cycle, so background tasks are always
+    # cancelled before returning, even if the cycle raises
+    poller = _ReceiptPoller(session, geth_url)
+    background = [asyncio.create_task(poller.run())]
+    background += [
+        asyncio.create_task(receipt_worker(i)) for i in range(receipt_concurrency)
     ]
-
-    start_time = time.time()
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
-    end_time = time.time()
+    try:
+        start_time = time.perf_counter()
+        await asyncio.gather(*(send_worker(i) for i in range(concurrency)))
+        # Drain receipts for everything submitted before the deadline; each
+        # wait is bounded by RECEIPT_TIMEOUT_SECONDS
+        await pending.join()
+        end_time = time.perf_counter()
+    finally:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
 
     duration = end_time - start_time
+    total_sent = sum(w.sent for w in stats)
+    total_failed = sum(w.failed for w in stats)
+    total_rpc_errors = sum(w.rpc_errors for w in stats)
+    total_gas_used = sum(w.gas_used for w in stats)
     total_tx = total_sent + total_failed
     tps = (total_tx / duration) if duration > 0 else 0.0
 
-    # Approximate RPC calls: gas_price + send_tx + receipt per attempt
-    total_rpc = total_tx * 3
+    # Approximate RPC calls: per-send calls plus batched receipt polls
+    total_rpc = sum(w.rpc_calls for w in stats) + poller.rpc_calls
     rps = (total_rpc / duration) if duration > 0 else 0.0
 
     mgas_per_sec = (total_gas_used / 1_000_000.0 / duration) if duration > 0 else 0.0
     failure_rate = (total_failed / total_tx) if total_tx > 0 else 0.0
 
-    avg_latency = (sum(latencies) / len(latencies)) if latencies else 0.0
+    latency_count = sum(w.latency_count for w in stats)
+    latency_sum = sum(w.latency_sum for w in stats)
+    avg_latency = (latency_sum / latency_count) if latency_count > 0 else 0.0
+    bucket_counts = [sum(col) for col in zip(*(w.latency_buckets for w in stats))]
+    p50 = latency_hist.get_value_at_percentile(50.0) / 1_000_000.0
+    p95 = latency_hist.get_value_at_percentile(95.0) / 1_000_000.0
+    p99 = latency_hist.get_value_at_percentile(99.0) / 1_000_000.0
 
     logger.info(
         "Load generation finished: sent=%s, failed=%s, duration=%.2fs",
@@ -210,20 +593,28 @@ def _run_load(
     )
     logger.info(
         "Metrics: TPS=%.2f, RPC_RPS=%.2f, MGas/s=%.4f, "
-        "failure_rate=%.2f%%, avg_latency=%.3fs",
+        "failure_rate=%.2f%%, avg_latency=%.3fs, p50=%.3fs, p95=%.3fs, p99=%.3fs",
         tps,
         rps,
         mgas_per_sec,
         failure_rate * 100.0,
         avg_latency,
+        p50,
+        p95,
+        p99,
     )
 
-    # Export metrics for Prometheus / Grafana
+    # Export metrics for Prometheus / Grafana in one batch at the end of the cycle
+    RPC_ERROR_COUNTER.inc(total_rpc_errors)
     METRIC_TPS.set(tps)
     METRIC_RPS.set(rps)
     METRIC_MGAS.set(mgas_per_sec)
     METRIC_FAILURE_RATE.set(failure_rate)
     METRIC_LATENCY.set(avg_latency)
+    METRIC_LATENCY_P50.set(p50)
+    METRIC_LATENCY_P95.set(p95)
+    METRIC_LATENCY_P99.set(p99)
+    _flush_latency_histogram(bucket_counts, latency_sum)
 
 
 def main() -> int:
@@ -263,8 +654,18 @@ def main() -> int:
         start_http_server(metrics_port)
         logger.info("Prometheus metrics server started on port %s", metrics_port)
 
-        # Background updater for head block metric so rate() works
+        # Background updater for head block metric so rate() works. With
+        # GETH_WS_URL set, new heads are pushed over WebSocket; polling over
+        # HTTP is the fallback if that is unset or the subscription drops.
         def _update_head_block_metric() -> None:
+            ws_url = os.getenv("GETH_WS_URL")
+            if ws_url:
+                try:
+                    asyncio.run(_follow_new_heads(ws_url))
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("newHeads subscription on %s failed: %s", ws_url, exc)
+                logger.info("Falling back to polling for head block metric")
+
             while True:
                 try:
                     current_block = w3.eth.block_number
@@ -275,6 +676,14 @@ def main() -> int:
 
         threading.Thread(target=_update_head_block_metric, daemon=True).start()
 
+        # Seed the gas price cache before any worker reads it, then keep it
+        # fresh; load cycles are skipped until a price has been cached
+        try:
+            _gas_price_cache[0] = w3.eth.gas_price
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to seed gas price cache: %s", exc)
+        threading.Thread(target=_refresh_gas_price, args=(w3,), daemon=True).start()
+
         # Check balance of the required prefunded account, if present
         target_account = "0x62358b29b9e3e70ff51D88766e41a339D3e8FFff"
         try:
@@ -291,35 +700,54 @@ def main() -> int:
                 "Failed to query balance for %s: %s", target_account, exc
             )
 
+        # Optional key for client-side signing; without it the node signs
+        # transactions with its first unlocked account
+        sender_key = os.getenv("SENDER_PRIVATE_KEY")
+        sender = Account.from_key(sender_key) if sender_key else None
+        if sender is not None:
+            logger.info("Signing transactions locally as %s", sender.address)
+
         # Load generation configuration (loop forever in a Deployment)
         while True:
             target_tps = int(os.getenv("TARGET_TPS", "0"))
             concurrency = int(os.getenv("CONCURRENCY", "0"))
             duration_seconds = int(os.getenv("DURATION_SECONDS", "60"))
 
-            if target_tps > 0 and concurrency > 0:
-                accounts = w3.eth.accounts
-                if not accounts:
-                    logger.error(
-                        "No accounts available from eth_accounts; cannot generate load."
-                    )
-                    time.sleep(10)
-                    continue
-
-                from_address = accounts[0]
+            if target_tps > 0 and concurrency > 0 and _gas_price_cache[0] is None:
+                logger.warning("Gas price not cached yet; skipping load generation cycle.")
+            elif target_tps > 0 and concurrency > 0:
+                if sender is not None:
+                    from_address = sender.address
+                else:
+                    accounts = w3.eth.accounts
+                    if not accounts:
+                        logger.error(
+                            "No accounts available from eth_accounts; cannot generate load."
+                        )
+                        time.sleep(10)
+                        continue
+
+                    from_address = accounts[0]
                 logger.info(
                     "Starting load generation: TARGET_TPS=%s, CONCURRENCY=%s, DURATION_SECONDS=%s",
                     target_tps,
                     concurrency,
                     duration_seconds,
                 )
-                _run_load(
-                    w3=w3,
-                    from_address=from_address,
-                    to_address=target_account,
-                    target_tps=target_tps,
-                    concurrency=concurrency,
-                    duration_seconds=duration_seconds,
+                client = _get_async_client(geth_url, pool_size=concurrency * 2)
+                client.loop.run_until_complete(
+                    _run_load(
+                        w3=client.w3,
+                        session=client.session,
+                        geth_url=geth_url,
+                        from_address=from_address,
+                        to_address=target_account,
+                        target_tps=target_tps,
+                        concurrency=concurrency,
+                        duration_seconds=duration_seconds,
+                        sender=sender,
+                        receipt_concurrency=int(os.getenv("RECEIPT_CONCURRENCY", "0")),
+                    )
                 )
             else:
                 logger.info(